@@ -1,6 +1,11 @@
 from django.conf import settings
 from django.utils.module_loading import import_string
 
+DEFAULT_CONFIG_CLASS = 'adyen.settings_config.FromSettingsConfig'
+
+# Config classes already imported, keyed by their python import path.
+_config_class_cache = {}
+
 
 def get_config():
     """Returns an instance of the configured config class.
@@ -19,12 +24,18 @@ def get_config():
         represent the python import path of the Adyen config class, such as
         ``adyen.settings_config.FromSettingsConfig``.
 
+    The config class is imported only once per import path; a new instance is
+    still returned on each call, so settings are read at call time.
+
     """
+    config_class_string = getattr(
+        settings, 'ADYEN_CONFIG_CLASS', DEFAULT_CONFIG_CLASS)
     try:
-        config_class_string = settings.ADYEN_CONFIG_CLASS
-    except AttributeError:
-        config_class_string = 'adyen.settings_config.FromSettingsConfig'
-    return import_string(config_class_string)()
+        config_class = _config_class_cache[config_class_string]
+    except KeyError:
+        config_class = import_string(config_class_string)
+        _config_class_cache[config_class_string] = config_class
+    return config_class()
 
 
 class AbstractAdyenConfig:
@@ -1,8 +1,9 @@
 # -*- coding: utf-8 -*-
 
 import logging
+import re
+import socket
 
-import iptools
 from django.http import HttpResponse
 from django.utils.module_loading import import_string
 from oscar.core.loading import get_class
@@ -18,6 +19,26 @@ PaymentRedirection = get_class('adyen.gateway', 'PaymentRedirection')
 
 logger = logging.getLogger('adyen')
 
+_IPV4_OCTET = r'(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)'
+_IPV4_RE = re.compile(r'(?:{0}\.){{3}}{0}'.format(_IPV4_OCTET))
+
+
+def _is_valid_ip_address(s):
+    """
+    Make sure that a string is a valid representation of an IP address.
+    IPv4 addresses are matched against a precompiled pattern; anything
+    with a colon is parsed as an IPv6 address by `socket.inet_pton`.
+    """
+    if not isinstance(s, str):
+        return False
+    if ':' not in s:
+        return _IPV4_RE.fullmatch(s) is not None
+    try:
+        socket.inet_pton(socket.AF_INET6, s)
+    except (OSError, ValueError):
+        return False
+    return True
+
 
 def get_gateway(request, config):
     """Instantiate a :class:`adyen.gateway.Gateway` from ``config``.
@@ -82,10 +103,9 @@ class Facade:
     def _is_valid_ip_address(cls, s):
         """
         Make sure that a string is a valid representation of an IP address.
-        Relies on the iptools package, even though Python 3.4 gave us the new
-        shiny `ipaddress` module in the stdlib.
+        Override this method to change how origin IP addresses are validated.
         """
-        return iptools.ipv4.validate_ip(s) or iptools.ipv6.validate_ip(s)
+        return _is_valid_ip_address(s)
 
     def _get_origin_ip_address(self, request):
         """
@@ -101,11 +121,8 @@ class Facade:
         Django setting. We fallback on the canonical `REMOTE_ADDR`, used for
         regular, unproxied requests.
         """
-        ip_address_http_header = self.config.get_ip_address_header()
-
-        try:
-            ip_address = request.META[ip_address_http_header]
-        except KeyError:
+        ip_address = request.META.get(self.config.get_ip_address_header())
+        if not ip_address:
             return None
 
         if not self._is_valid_ip_address(ip_address):
@@ -52,9 +52,23 @@ class Gateway:
 
 
 class BaseInteraction:
+    __slots__ = ('client', 'params')
+
     REQUIRED_FIELDS = ()
     OPTIONAL_FIELDS = ()
 
+    # Fields starting with one of these prefixes are never unexpected.
+    IGNORED_FIELD_PREFIXES = ('openinvoicedata.',)
+
+    # Set versions of the fields above, computed once per class.
+    _REQUIRED_FIELDS_SET = frozenset()
+    _ALL_FIELDS = frozenset()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._REQUIRED_FIELDS_SET = frozenset(cls.REQUIRED_FIELDS)
+        cls._ALL_FIELDS = cls._REQUIRED_FIELDS_SET | frozenset(cls.OPTIONAL_FIELDS)
+
     def validate(self):
         self.check_fields()
 
@@ -66,26 +80,30 @@ class BaseInteraction:
         params = self.params
 
         # Check that all mandatory fields are present.
-        for field_name in self.REQUIRED_FIELDS:
-            if field_name not in params:
-                raise MissingFieldException(
-                    "The %s field is missing" % field_name
-                )
+        missing_fields = self._REQUIRED_FIELDS_SET - params.keys()
+        if missing_fields:
+            raise MissingFieldException(
+                "The following fields are missing: %s"
+                % ', '.join(sorted(missing_fields))
+            )
 
         # Check that no unexpected field is present.
-        expected_fields = self.REQUIRED_FIELDS + self.OPTIONAL_FIELDS
-        for field_name in params.keys():
-            if field_name.startswith('openinvoicedata.'):
-                continue
-            if field_name not in expected_fields:
-                raise UnexpectedFieldException(
-                    "The %s field is unexpected" % field_name
-                )
+        unexpected_fields = [
+            field_name for field_name in params.keys() - self._ALL_FIELDS
+            if not field_name.startswith(self.IGNORED_FIELD_PREFIXES)
+        ]
+        if unexpected_fields:
+            raise UnexpectedFieldException(
+                "The following fields are unexpected: %s"
+                % ', '.join(sorted(unexpected_fields))
+            )
 
 
 # ---[ FORM-BASED REQUESTS ]---
 
 class PaymentFormRequest(BaseInteraction):
+    __slots__ = ()
+
     REQUIRED_FIELDS = (
         Constants.MERCHANT_ACCOUNT,
         Constants.MERCHANT_REFERENCE,
@@ -167,6 +185,7 @@ class PaymentFormRequest(BaseInteraction):
 # ---[ RESPONSES ]---
 
 class BaseResponse(BaseInteraction):
+    __slots__ = ('secret_key',)
 
     def __init__(self, client, params):
         self.client = client
@@ -190,6 +209,8 @@ class PaymentNotification(BaseResponse):
     - unexpected: We loudly complain.
 
     """
+    __slots__ = ()
+
     REQUIRED_FIELDS = (
         Constants.CURRENCY,
         Constants.EVENT_CODE,
@@ -222,8 +243,8 @@ class PaymentNotification(BaseResponse):
         :return:
         """
         self.params = {
-            key: self.params[key]
-            for key in self.params if Constants.ADDITIONAL_DATA_PREFIX not in key
+            key: value for key, value in self.params.items()
+            if not key.startswith(Constants.ADDITIONAL_DATA_PREFIX)
         }
         super().check_fields()
 
@@ -241,6 +262,8 @@ class PaymentRedirection(BaseResponse):
     When they paid on Adyen and get redirected back to our site. HTTP GET from
     user's browser.
     """
+    __slots__ = ()
+
     REQUIRED_FIELDS = (
         Constants.AUTH_RESULT,
         Constants.MERCHANT_REFERENCE,
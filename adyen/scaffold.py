@@ -23,6 +23,15 @@ def sanitize_field(value):
     return str(value).replace('\n', ' ').replace('\r', ' ').strip()
 
 
+def _now():
+    """Return the current time used to build the payment form fields.
+
+    Tests patch this helper to freeze the scaffold's clock without touching
+    ``django.utils.timezone.now`` for the rest of the process.
+    """
+    return timezone.now()
+
+
 class Scaffold:
     """Entry point to handle Adyen HPP.
 
@@ -87,7 +96,7 @@ class Scaffold:
         return Facade().build_payment_form_fields(request, field_specs)
 
     def get_field_specs(self, request, order_data):
-        now = timezone.now()
+        now = _now()
         session_validity = now + timezone.timedelta(minutes=20)
         session_validity_format = '%Y-%m-%dT%H:%M:%SZ'
         ship_before_date = now + timezone.timedelta(days=30)
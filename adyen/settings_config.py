@@ -1,9 +1,29 @@
+import functools
+
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
+from django.core.signals import setting_changed
+from django.dispatch import receiver
 
 from .config import AbstractAdyenConfig
 
 
+@functools.lru_cache(maxsize=None)
+def _resolved_ip_header():
+    """Return the ``request.META`` key holding the origin IP address.
+
+    The setting is read once, then cached until it changes.
+    """
+    return getattr(settings, 'ADYEN_IP_ADDRESS_HTTP_HEADER', 'REMOTE_ADDR')
+
+
+@receiver(setting_changed)
+def _clear_resolved_ip_header(setting, **kwargs):
+    """Forget the cached IP address header when its setting changes."""
+    if setting == 'ADYEN_IP_ADDRESS_HTTP_HEADER':
+        _resolved_ip_header.cache_clear()
+
+
 class FromSettingsConfig(AbstractAdyenConfig):
     """Manage Plugin's configuration from the project's settings.
 
@@ -70,10 +90,7 @@ class FromSettingsConfig(AbstractAdyenConfig):
         If the setting is not configured, the default value ``REMOTE_ADDR`` is
         returned instead.
         """
-        try:
-            return settings.ADYEN_IP_ADDRESS_HTTP_HEADER
-        except AttributeError:
-            return 'REMOTE_ADDR'
+        return _resolved_ip_header()
 
     def get_allowed_methods(self, request, source_type=None):
         """Return :data:`ADYEN_ALLOWED_METHODS` or ``None``.
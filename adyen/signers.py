@@ -53,6 +53,8 @@ class AbstractSigner:
         This secret key is used to sign payment request, and verify payment
         return response and payment notification.
         """
+        self._hmac_key = None
+        self._hmac = None
 
     def sign(self, fields):
         """Sign the given form ``fields`` and return the signature fields.
@@ -130,6 +132,26 @@ class AbstractSigner:
         """
         raise NotImplementedError
 
+    def _compute_hmac(self, key, digestmod, signature):
+        """Return the base64-encoded HMAC of ``signature``.
+
+        :param bytes key: The key bytes, derived from :attr:`secret_key`.
+        :param digestmod: The hash algorithm, such as ``hashlib.sha1``.
+        :param str signature: The signing string to hash.
+
+        The keyed HMAC is built once, then copied for each hash. It is built
+        again whenever the key (or the algorithm) changes, so updating
+        :attr:`secret_key` takes effect on the next hash.
+        """
+        keyed_hmac = getattr(self, '_hmac', None)
+        if keyed_hmac is None or self._hmac_key != (key, digestmod):
+            keyed_hmac = hmac.new(key, digestmod=digestmod)
+            self._hmac_key = (key, digestmod)
+            self._hmac = keyed_hmac
+        signature_hmac = keyed_hmac.copy()
+        signature_hmac.update(signature.encode('utf-8'))
+        return base64.b64encode(signature_hmac.digest()).decode('ascii')
+
 
 class HMACSha1(AbstractSigner):
     """Implement a HMAC signature with SHA-1 algorithm.
@@ -289,10 +311,8 @@ class HMACSha1(AbstractSigner):
             The :meth:`AbstractSigner.compute_hash` method for usage.
 
         """
-        hm = hmac.new(self.secret_key.encode('utf-8'),
-                      signature.encode('utf-8'),
-                      hashlib.sha1)
-        return base64.encodebytes(hm.digest()).strip().decode('utf-8')
+        return self._compute_hmac(
+            self.secret_key.encode('utf-8'), hashlib.sha1, signature)
 
 
 def is_valid_key(key):
@@ -387,9 +407,5 @@ class HMACSha256(AbstractSigner):
             The :meth:`AbstractSigner.compute_hash` method for usage.
 
         """
-        secret_key = binascii.a2b_hex(self.secret_key)
-        hm = hmac.new(secret_key,
-                      signature.encode('utf-8'),
-                      hashlib.sha256)
-
-        return base64.encodebytes(hm.digest()).strip().decode('utf-8')
+        return self._compute_hmac(
+            binascii.a2b_hex(self.secret_key), hashlib.sha256, signature)
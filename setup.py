@@ -13,7 +13,6 @@ setup(
     packages=find_packages(),
     include_package_data=True,
     install_requires=[
-        'iptools==0.6.1',
         'django-oscar>=2.0',
     ],
     classifiers=[
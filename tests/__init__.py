@@ -1,18 +1,69 @@
-from copy import deepcopy
+from django.conf import settings
+from django.db.models import Count
+
+from adyen.constants import Constants
+from adyen.signers import HMACSha1
+
+
+def sign_return_params(params):
+    """
+    Return a copy of the payment return ``params`` with a ``merchantSig``
+    computed with the test secret key, so fixtures don't need hand-made
+    signatures.
+
+    This reuses the signer's own signing string, so it can't catch a
+    regression in it: the pinned signatures of these fixtures are checked
+    by the ``test_verify_return_*`` tests of ``test_signers_sha1``.
+    """
+    signer = HMACSha1(settings.ADYEN_SECRET_KEY)
+    signature = ''.join(
+        str(params.get(key, '')) for key in signer.PAYMENT_RETURN_HASH_KEYS)
+    return {**params, Constants.MERCHANT_SIG: signer.compute_hash(signature)}
 
 
 class MockRequest:
+    """
+    Minimal stand-in for a Django request.
+
+    The given ``data`` is shallow-copied into ``GET`` or ``POST``, so tests
+    can share module-level payload constants and still mutate their request.
+    """
+    __slots__ = ('method', 'GET', 'POST', 'META')
 
     def __init__(self, data=None, method='GET', remote_address='127.0.0.1'):
         self.method = method
-        self.META = {}
+        self.GET = {}
+        self.POST = {}
 
         if method == 'GET':
-            self.GET = deepcopy(data) or {}
+            self.GET = dict(data or {})
         elif method == 'POST':
-            self.POST = deepcopy(data) or {}
+            self.POST = dict(data or {})
 
         # Most tests use unproxied requests, the case of proxied ones
         # is unit-tested by the `test_get_origin_ip_address` method.
-        if remote_address is not None:
-            self.META['REMOTE_ADDR'] = remote_address
+        if remote_address is None:
+            self.META = {}
+        else:
+            self.META = {'REMOTE_ADDR': remote_address}
+
+
+class TransactionAssertionsMixin:
+    """
+    Helpers to check the recorded `AdyenTransaction` rows from a test case.
+    """
+
+    def _all_status_counts(self):
+        """
+        Return the number of recorded transactions per status, in a single query.
+        """
+        # Imported here as this package is loaded along with the test settings,
+        # before the Django app registry is ready.
+        from adyen.models import AdyenTransaction
+
+        return dict(
+            AdyenTransaction.objects
+            .order_by()
+            .values_list('status')
+            .annotate(Count('id'))
+        )
@@ -0,0 +1,60 @@
+import pytest
+
+from adyen.facade import Facade
+from adyen.scaffold import Scaffold
+from adyen.signers import HMACSha1, HMACSha256
+
+TEST_SHA1_SECRET_KEY = 'oscaroscaroscaro'
+
+# Taken from the Adyen documentation, see `test_signers_sha256`.
+TEST_SHA256_SECRET_KEY = '4468D9782DEF54FCD706C9100C71EC43932B1EBC2ACF6BA0560C05AAA7550C48'
+
+
+@pytest.fixture(scope='module')
+def sha1_signer():
+    return HMACSha1(TEST_SHA1_SECRET_KEY)
+
+
+@pytest.fixture(scope='module')
+def sha256_signer():
+    return HMACSha256(TEST_SHA256_SECRET_KEY)
+
+
+@pytest.fixture(scope='module')
+def scaffold():
+    return Scaffold()
+
+
+@pytest.fixture(scope='module')
+def facade():
+    """
+    A facade shared by the tests of a module.
+
+    ``Facade()`` fixes its config instance when built: tests that override
+    ``ADYEN_CONFIG_CLASS`` need a facade of their own.
+    """
+    return Facade()
+
+
+@pytest.fixture
+def base_fields():
+    """
+    Payment request form fields, as given to the signers.
+
+    Tests may update them, so each test gets its own copy.
+    """
+    return {
+        'merchantReturnData': 123,
+        'paymentAmount': 123,
+        'countryCode': 'fr',
+        'currencyCode': 'EUR',
+        'sessionValidity': '2014-07-31T17:20:00Z',
+        'merchantReference': '00000000123',
+        'shopperEmail': 'test@example.com',
+        'shopperLocale': 'fr',
+        'shopperReference': 789,
+        'resURL': 'https://www.example.com/checkout/return/adyen/',
+        'shipBeforeDate': '2014-08-30',
+        'skinCode': 'cqQJKZpg',
+        'merchantAccount': 'OscaroFR'
+    }
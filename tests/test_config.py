@@ -1,10 +1,12 @@
 import unittest
+from unittest import mock
 
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
-from django.test import TestCase
+from django.test import SimpleTestCase
 from django.test.client import RequestFactory
 from django.test.utils import override_settings
+from django.utils.module_loading import import_string
 
 # We use get_config() instead of adyen_config because throughout
 # the tests, we repeatedly change the Django settings.
@@ -61,7 +63,7 @@ class TestAbstractAdyenConfig(unittest.TestCase):
     ADYEN_ACTION_URL='foo',
     ADYEN_SKIN_CODE='foo',
 )
-class TestFromSettings(TestCase):
+class TestFromSettings(SimpleTestCase):
     """
     This test case tests the FromSettings config class, which just fetches its
     values from the Django settings.
@@ -118,7 +120,7 @@ class DummyConfigClass(AbstractAdyenConfig):
 
 
 @override_settings(ADYEN_CONFIG_CLASS='tests.test_config.DummyConfigClass')
-class CustomConfigClassTestCase(TestCase):
+class CustomConfigClassTestCase(SimpleTestCase):
     """
     This test case checks that it's possible to replace the FromSettings confic class
     by one's own, and that it is used to fetch values as expected.
@@ -133,3 +135,25 @@ class CustomConfigClassTestCase(TestCase):
         Check that we indeed ignore Django settings (apart from the config class).
         """
         assert get_config().get_action_url(None) == 'foo'
+
+
+class ConfigClassCacheTestCase(SimpleTestCase):
+    """
+    This test case checks that the config class is only imported once per import path.
+    """
+
+    @override_settings(ADYEN_CONFIG_CLASS='tests.test_config.DummyConfigClass')
+    @mock.patch.dict('adyen.config._config_class_cache', clear=True)
+    def test_config_class_is_imported_once(self):
+        with mock.patch('adyen.config.import_string', wraps=import_string) as import_mock:
+            first, second = get_config(), get_config()
+
+        assert import_mock.call_count == 1
+        assert isinstance(first, DummyConfigClass)
+        assert first is not second
+
+    def test_config_class_follows_setting(self):
+        assert isinstance(get_config(), FromSettingsConfig)
+        with override_settings(ADYEN_CONFIG_CLASS='tests.test_config.DummyConfigClass'):
+            assert isinstance(get_config(), DummyConfigClass)
+        assert isinstance(get_config(), FromSettingsConfig)
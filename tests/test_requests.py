@@ -1,30 +1,36 @@
+import datetime
+from unittest import mock
+
+import pytest
 from django.conf import settings
-from django.test import TestCase, override_settings
-from freezegun import freeze_time
+from django.test import override_settings
 
 from adyen.gateway import MissingFieldException
-from adyen.scaffold import Scaffold
 
 TEST_RETURN_URL = 'https://www.example.com/checkout/return/adyen/'
+# Any datetime will do.
+TEST_FROZEN_TIME = datetime.datetime(2014, 7, 31, 17, 0, 0, tzinfo=datetime.timezone.utc)
 
-EXPECTED_FIELDS_LIST = [
-    {'type': 'hidden', 'name': 'currencyCode', 'value': 'EUR'},
-    {'type': 'hidden', 'name': 'merchantAccount', 'value': settings.ADYEN_IDENTIFIER},
-    {'type': 'hidden', 'name': 'merchantReference', 'value': '00000000123'},
-    {'type': 'hidden', 'name': 'merchantReturnData', 'value': '123'},
-    {'type': 'hidden', 'name': 'merchantSig', 'value': 'kKvzRvx7wiPLrl8t8+owcmMuJZM='},
-    {'type': 'hidden', 'name': 'paymentAmount', 'value': '123'},
-    {'type': 'hidden', 'name': 'resURL', 'value': TEST_RETURN_URL},
-    {'type': 'hidden', 'name': 'sessionValidity', 'value': '2014-07-31T17:20:00Z'},
-    {'type': 'hidden', 'name': 'shipBeforeDate', 'value': '2014-08-30'},
-    {'type': 'hidden', 'name': 'shopperEmail', 'value': 'test@example.com'},
-    {'type': 'hidden', 'name': 'shopperLocale', 'value': 'fr'},
-    {'type': 'hidden', 'name': 'shopperReference', 'value': '789'},
-    {'type': 'hidden', 'name': 'skinCode', 'value': 'cqQJKZpg'},
-    {'type': 'hidden', 'name': 'countryCode', 'value': 'fr'},
-    {'type': 'hidden', 'name': 'brandCode', 'value': 'ideal'},
-    {'type': 'hidden', 'name': 'issuerId', 'value': '1211'},
-]
+# Every payment form field is a hidden input. Order doesn't matter, so fields
+# are compared as a set of (type, name, value) tuples.
+EXPECTED_FIELDS = frozenset(('hidden', name, value) for name, value in [
+    ('currencyCode', 'EUR'),
+    ('merchantAccount', settings.ADYEN_IDENTIFIER),
+    ('merchantReference', '00000000123'),
+    ('merchantReturnData', '123'),
+    ('merchantSig', 'kKvzRvx7wiPLrl8t8+owcmMuJZM='),
+    ('paymentAmount', '123'),
+    ('resURL', TEST_RETURN_URL),
+    ('sessionValidity', '2014-07-31T17:20:00Z'),
+    ('shipBeforeDate', '2014-08-30'),
+    ('shopperEmail', 'test@example.com'),
+    ('shopperLocale', 'fr'),
+    ('shopperReference', '789'),
+    ('skinCode', 'cqQJKZpg'),
+    ('countryCode', 'fr'),
+    ('brandCode', 'ideal'),
+    ('issuerId', '1211'),
+])
 
 ORDER_DATA = {
     'amount': 123,
@@ -43,34 +49,43 @@ ORDER_DATA = {
 }
 
 
-class TestAdyenPaymentRequest(TestCase):
+@pytest.fixture(scope='module', autouse=True)
+def frozen_now():
+    """
+    Freeze the current time used by the scaffold for the whole module.
+
+    Only the scaffold's own clock helper is patched, so
+    ``django.utils.timezone.now`` is left alone for other callers.
+    """
+    with mock.patch('adyen.scaffold._now', return_value=TEST_FROZEN_TIME):
+        yield
+
+
+@override_settings(ADYEN_ACTION_URL='foo')
+def test_form_action(scaffold):
+    """
+    Test that the form action is properly fetched from the settings.
+    """
+    assert 'foo' == scaffold.get_form_action(request=None)
+
 
-    @override_settings(ADYEN_ACTION_URL='foo')
-    def test_form_action(self):
-        """
-        Test that the form action is properly fetched from the settings.
-        """
-        assert 'foo' == Scaffold().get_form_action(request=None)
+def test_form_fields_ok(scaffold):
+    """
+    Test that the payment form fields list is properly built.
+    """
+    fields_list = scaffold.get_form_fields(request=None, order_data=ORDER_DATA)
+    assert len(fields_list) == len(EXPECTED_FIELDS)
+    actual = frozenset((f['type'], f['name'], f['value']) for f in fields_list)
+    assert actual == EXPECTED_FIELDS
 
-    def test_form_fields_ok(self):
-        """
-        Test that the payment form fields list is properly built.
-        """
-        with freeze_time('2014-07-31 17:00:00'):  # Any datetime will do.
-            fields_list = Scaffold().get_form_fields(request=None, order_data=ORDER_DATA)
-            # Order doesn't matter, so normally we'd use a set. But Python doesn't do
-            # sets of dictionaries, so we compare individually.
-            assert len(fields_list) == len(EXPECTED_FIELDS_LIST)
-            for field in fields_list:
-                assert field in EXPECTED_FIELDS_LIST
 
-    def test_form_fields_with_missing_mandatory_field(self):
-        """
-        Test that the proper exception is raised when trying
-        to build a fields list with a missing mandatory field.
-        """
-        new_order_data = ORDER_DATA.copy()
-        del new_order_data['amount']
+def test_form_fields_with_missing_mandatory_field(scaffold):
+    """
+    Test that the proper exception is raised when trying
+    to build a fields list with a missing mandatory field.
+    """
+    new_order_data = ORDER_DATA.copy()
+    del new_order_data['amount']
 
-        with self.assertRaises(MissingFieldException):
-            Scaffold().get_form_fields(request=None, order_data=new_order_data)
+    with pytest.raises(MissingFieldException):
+        scaffold.get_form_fields(request=None, order_data=new_order_data)
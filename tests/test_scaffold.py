@@ -33,67 +33,48 @@ class TestScaffold(unittest.TestCase):
         street, housenr = scaffold.get_street_housenr(address)
         assert housenr == '1'
 
-    def test_get_fields_delivery(self):
+    def test_get_fields_addresses(self):
         scaffold = Scaffold()
 
-        address = ShippingAddress(
-            first_name='First Name',
-            last_name='Last Name',
-            line1='First Line Address 1',
-            line4='Bruxelles',
-            postcode='1000',
-            country_id='BE')
-
-        order_data = {
-            'shipping_address': address
-        }
-        fields = scaffold.get_fields_delivery(None, order_data)
-
-        assert Constants.DELIVERY_STREET in fields
-        assert Constants.DELIVERY_NUMBER in fields
-        assert Constants.DELIVERY_CITY in fields
-        assert Constants.DELIVERY_POSTCODE in fields
-        assert Constants.DELIVERY_STATE in fields
-        assert Constants.DELIVERY_COUNTRY in fields
-
-        assert fields[Constants.DELIVERY_STREET] == 'First Line Address'
-        assert fields[Constants.DELIVERY_NUMBER] == '1', (
-            'Since Oscar does not provide a street number we set a fake value')
-        assert fields[Constants.DELIVERY_CITY] == address.city
-        assert fields[Constants.DELIVERY_POSTCODE] == address.postcode
-        assert fields[Constants.DELIVERY_STATE] == address.state
-        assert fields[Constants.DELIVERY_COUNTRY] == address.country_id
-
-    def test_get_fields_billing(self):
-        scaffold = Scaffold()
-
-        address = BillingAddress(
-            first_name='First Name',
-            last_name='Last Name',
-            line1='First Line Address 1',
-            line4='Bruxelles',
-            postcode='1000',
-            country_id='BE')
-
-        order_data = {
-            'billing_address': address
-        }
-        fields = scaffold.get_fields_billing(None, order_data)
-
-        assert Constants.BILLING_STREET in fields
-        assert Constants.BILLING_NUMBER in fields
-        assert Constants.BILLING_CITY in fields
-        assert Constants.BILLING_POSTCODE in fields
-        assert Constants.BILLING_STATE in fields
-        assert Constants.BILLING_COUNTRY in fields
-
-        assert fields[Constants.BILLING_STREET] == 'First Line Address'
-        assert fields[Constants.BILLING_NUMBER] == '1', (
-            'Since Oscar does not provide a street number we set a fake value')
-        assert fields[Constants.BILLING_CITY] == address.city
-        assert fields[Constants.BILLING_POSTCODE] == address.postcode
-        assert fields[Constants.BILLING_STATE] == address.state
-        assert fields[Constants.BILLING_COUNTRY] == address.country_id
+        # (address model, order data key, scaffold method, Constants prefix)
+        cases = [
+            (ShippingAddress, 'shipping_address', scaffold.get_fields_delivery, 'DELIVERY'),
+            (BillingAddress, 'billing_address', scaffold.get_fields_billing, 'BILLING'),
+        ]
+
+        for address_class, order_data_key, get_fields, prefix in cases:
+            with self.subTest(prefix=prefix):
+                address = address_class(
+                    first_name='First Name',
+                    last_name='Last Name',
+                    line1='First Line Address 1',
+                    line4='Bruxelles',
+                    postcode='1000',
+                    country_id='BE')
+
+                order_data = {
+                    order_data_key: address
+                }
+                fields = get_fields(None, order_data)
+
+                street, number, city, postcode, state, country = (
+                    getattr(Constants, '%s_%s' % (prefix, name))
+                    for name in ('STREET', 'NUMBER', 'CITY', 'POSTCODE', 'STATE', 'COUNTRY'))
+
+                assert street in fields
+                assert number in fields
+                assert city in fields
+                assert postcode in fields
+                assert state in fields
+                assert country in fields
+
+                assert fields[street] == 'First Line Address'
+                assert fields[number] == '1', (
+                    'Since Oscar does not provide a street number we set a fake value')
+                assert fields[city] == address.city
+                assert fields[postcode] == address.postcode
+                assert fields[state] == address.state
+                assert fields[country] == address.country_id
 
     def test_get_fields_shopper(self):
         scaffold = Scaffold()
@@ -1,4 +1,7 @@
-from django.test import TestCase, override_settings
+from unittest import mock
+
+import pytest
+from django.test import SimpleTestCase
 
 from adyen.facade import Facade
 from adyen.gateway import (
@@ -10,77 +13,113 @@ from adyen.gateway import (
 from tests import MockRequest
 
 
-def test_is_valid_ip_address():
+@pytest.mark.parametrize('ip,ok', [
     # Valid IPv4 and IPv6 addresses
-    valid_addresses = ['127.0.0.1', '192.168.12.34', '2001:0db8:85a3:0000:0000:8a2e:0370:7334']
-    for address in valid_addresses:
-        assert Facade._is_valid_ip_address(address)
-
+    ('127.0.0.1', True),
+    ('192.168.12.34', True),
+    ('2001:0db8:85a3:0000:0000:8a2e:0370:7334', True),
+    ('::ffff:192.168.12.34', True),
     # Empty string, noise, IPv4 out of range, invalid IPv6-lookalike
-    invalid_addresses = ['', 'TOTORO', '192.168.12.345', '2001::0234:C1ab::A0:aabc:003F']
-    for address in invalid_addresses:
-        assert not Facade._is_valid_ip_address(address)
+    ('', False),
+    ('TOTORO', False),
+    ('192.168.12.345', False),
+    ('192.168.12', False),
+    ('2001::0234:C1ab::A0:aabc:003F', False),
+])
+def test_is_valid_ip_address(ip, ok):
+    assert Facade._is_valid_ip_address(ip) is ok
 
 
 TEST_IP_ADDRESS_HTTP_HEADER = 'HTTP_X_FORWARDED_FOR'
 
 
-def test_get_origin_ip_address():
+def test_get_origin_ip_address(facade):
     """
-    Make sure that the `_get_origin_ip_address()` method works with all
-    the possible meaningful combinations of default and custom HTTP header
-    names.
+    Make sure that the `_get_origin_ip_address()` method works with the
+    default HTTP header name.
     """
-    get_ip_address = Facade()._get_origin_ip_address
     # With no specified ADYEN_IP_ADDRESS_HTTP_HEADER setting,
     # ensure we fetch the origin IP address in the REMOTE_ADDR
     # HTTP header.
-    assert '127.0.0.1' == get_ip_address(MockRequest())
+    assert '127.0.0.1' == facade._get_origin_ip_address(MockRequest())
 
     # Check the return value is None if we have nothing
     # in the `REMOTE_ADDR` header.
-    assert get_ip_address(MockRequest(remote_address='')) is None
+    assert facade._get_origin_ip_address(MockRequest(remote_address='')) is None
 
     # Check the return value is None if we have no `REMOTE_ADDR`
     # header at all.
-    assert get_ip_address(MockRequest(remote_address=None)) is None
+    assert facade._get_origin_ip_address(MockRequest(remote_address=None)) is None
+
+
+@mock.patch('adyen.settings_config._resolved_ip_header',
+            new=lambda: TEST_IP_ADDRESS_HTTP_HEADER)
+def test_get_origin_ip_address_with_custom_header(facade):
+    """
+    Make sure that the `_get_origin_ip_address()` method works with a
+    custom HTTP header name.
+
+    The resolved header is patched directly; reading it from the
+    `ADYEN_IP_ADDRESS_HTTP_HEADER` setting is tested along with the config.
+    """
+    # Now we add the `HTTP_X_FORWARDED_FOR` header and
+    # ensure it is used instead.
+    request = MockRequest()
+    request.META.update({
+        'REMOTE_ADDR': '127.0.0.1',
+        TEST_IP_ADDRESS_HTTP_HEADER: '93.16.93.168'
+    })
+    assert '93.16.93.168' == facade._get_origin_ip_address(request)
 
-    with override_settings(ADYEN_IP_ADDRESS_HTTP_HEADER=TEST_IP_ADDRESS_HTTP_HEADER):
-        # Now we add the `HTTP_X_FORWARDED_FOR` header and
-        # ensure it is used instead.
-        request = MockRequest()
-        request.META.update({
-            'REMOTE_ADDR': '127.0.0.1',
-            'HTTP_X_FORWARDED_FOR': '93.16.93.168'
-        })
-        assert '93.16.93.168' == get_ip_address(request)
+    # Even if the default header is missing.
+    del request.META['REMOTE_ADDR']
+    assert '93.16.93.168' == facade._get_origin_ip_address(request)
 
-        # Even if the default header is missing.
-        del request.META['REMOTE_ADDR']
-        assert '93.16.93.168' == Facade()._get_origin_ip_address(request)
+    # And finally back to `None` if we have neither header.
+    del request.META[TEST_IP_ADDRESS_HTTP_HEADER]
+    assert facade._get_origin_ip_address(request) is None
 
-        # And finally back to `None` if we have neither header.
-        del request.META['HTTP_X_FORWARDED_FOR']
-        assert Facade()._get_origin_ip_address(request) is None
+
+def test_get_origin_ip_address_uses_overridden_validation():
+    """
+    Make sure that projects overriding `Facade._is_valid_ip_address()`
+    see their validation used.
+    """
+    class StrictFacade(Facade):
+        @classmethod
+        def _is_valid_ip_address(cls, s):
+            return False
+
+    assert StrictFacade()._get_origin_ip_address(MockRequest()) is None
 
 
 class MockClient:
     secret_key = None
 
 
-class PaymentNotificationTestCase(TestCase):
+# Notifications only read the client, so a single one can be shared.
+_MOCK_CLIENT = MockClient()
+
+
+class PaymentNotificationTestCase(SimpleTestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.required_params = dict.fromkeys(PaymentNotification.REQUIRED_FIELDS, 'FOO')
+        cls.optional_params = dict.fromkeys(PaymentNotification.OPTIONAL_FIELDS, 'FOO')
+        cls.additional_params = {Constants.ADDITIONAL_DATA_PREFIX + 'foo': 'FOO'}
 
     def create_mock_notification(self, required=True, optional=False, additional=False):
-        keys_to_set = []
+        params = {}
         if required:
-            keys_to_set += PaymentNotification.REQUIRED_FIELDS
+            params.update(self.required_params)
         if optional:
-            keys_to_set += PaymentNotification.OPTIONAL_FIELDS
+            params.update(self.optional_params)
         if additional:
-            keys_to_set += [Constants.ADDITIONAL_DATA_PREFIX + 'foo']
-        params = {key: 'FOO' for key in keys_to_set}
+            params.update(self.additional_params)
 
-        return PaymentNotification(MockClient(), params)
+        return PaymentNotification(_MOCK_CLIENT, params)
 
     def test_required_fields_are_required(self):
         notification = self.create_mock_notification(